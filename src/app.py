@@ -2,13 +2,11 @@
 import pandas as pd
 import numpy as np
 import streamlit as st
-import altair as alt
 import streamlit.components.v1 as components
 import json
-import time
-import math
+import re
 from pathlib import Path
-from typing import Iterable, Optional, Tuple, List, Dict
+from typing import Iterable, Optional, Tuple
 
 st.set_page_config(
     page_title = "강원 산불 시각화 프로젝트",
@@ -18,11 +16,12 @@ st.set_page_config(
 
 
 # 🔧 전처리 함수 정의
-def prep_bubble_data(d: pd.DataFrame) -> list[dict]:
+@st.cache_data(show_spinner=False)
+def prep_bubble_data(d: pd.DataFrame) -> str:
     d = d.dropna(subset=["피해면적_합계"])
 
     area_avg_by_region = (
-        d.groupby("GRNDS_SGG_NM")["피해면적_합계"]
+        d.groupby("GRNDS_SGG_NM", observed=True)["피해면적_합계"]
         .agg(["sum", "count"])
         .rename(columns={"sum": "피해면적_합계", "count": "화재건수"})
         .assign(평균_화재_규모=lambda x: x["피해면적_합계"] / x["화재건수"])
@@ -32,59 +31,68 @@ def prep_bubble_data(d: pd.DataFrame) -> list[dict]:
     # 컬럼명 JS용으로 정제
     area_avg_by_region.rename(columns={"GRNDS_SGG_NM": "GRNDs_SGG_NM"}, inplace=True)
 
-    return area_avg_by_region.to_dict(orient="records")
+    # 평균 피해 규모 등 실수는 반올림 없이 그대로 (json은 float를 왕복 가능한 최단 표현으로 기록)
+    return json.dumps(area_avg_by_region.to_dict(orient="records"), ensure_ascii=False)
 
-def prep_treemap_ignition_cause(d: pd.DataFrame, col: str = "IGTN_CS_NM"):
-    series = d[col].fillna("미상").astype(str).str.strip().replace({"": "미상", "undefined": "미상"})
-    counts = series.value_counts().to_dict()
-    children = [
-        {"name": name, "value": int(count)}
-        for name, count in counts.items()
-        if name != "기타"
-    ]
+@st.cache_data(show_spinner=False)
+def prep_treemap_ignition_cause(d: pd.DataFrame, col: str = "IGTN_CS_NM") -> str:
+    # 원인 코드화 후 bincount로 건수 집계 — 문자열 정리는 고유값에만 한 번씩 적용
+    #   (결측도 하나의 고유값으로 두어 첫 등장 순서 유지 → 동률 순서가 value_counts와 동일)
+    codes, uniques = pd.factorize(d[col], use_na_sentinel=False)
+    labels = pd.Series(uniques).fillna("미상").astype(str).str.strip().replace({"": "미상", "undefined": "미상"})
+    counts = (
+        pd.Series(np.bincount(codes, minlength=len(uniques)), index=labels.to_numpy(dtype=object))
+        .groupby(level=0, sort=False).sum()      # 정리 후 같아진 라벨 합치기
+        .sort_values(ascending=False, kind="stable")
+    )
+    children = (
+        counts[counts.index != "기타"]
+        .rename_axis("name")
+        .reset_index(name="value")
+        .to_dict("records")
+    )
 
-    return {"name": "화재원인", "children": children}
+    return json.dumps({"name": "화재원인", "children": children}, ensure_ascii=False)
 
+@st.cache_data(show_spinner=False)
 def prep_casualty_stack_area(
     df: pd.DataFrame,
     ymd_col: str = "OCRN_YMD",
     death_col: str = "DCSD_CNT",
     inj_col: str = "INJPSN_CNT",
-) -> Tuple[pd.DataFrame, List[Dict]]:
+) -> Tuple[pd.DataFrame, str]:
     """
     D3 면그래프(사망자·부상자)용 연도 집계 전처리.
 
     반환:
       - merged: year, deaths, injuries 컬럼을 가진 집계 DataFrame(int)
-      - records: [{"year": int, "deaths": int, "injuries": int}, ...]
+      - records: [{"year": int, "deaths": int, "injuries": int}, ...] 형태의 JSON 문자열
     """
-    # 컬럼 존재 확인(대/소문자 혼재 방어)
+    # 컬럼 존재 확인(대/소문자 혼재 방어) — 정확히 일치하는 이름이 없으면 대소문자 무시로 찾기
     cols_map = {c.lower(): c for c in df.columns}
-    for need in (ymd_col, death_col, inj_col):
-        if need not in df.columns and need.lower() in cols_map:
-            locals()[need.split("_")[0] + "_col"] = cols_map[need.lower()]
+    ymd_col, death_col, inj_col = (
+        c if c in df.columns else cols_map.get(c.lower(), c)
+        for c in (ymd_col, death_col, inj_col)
+    )
     for need in (ymd_col, death_col, inj_col):
         if need not in df.columns:
             raise KeyError(f"필수 컬럼이 없습니다: {need}")
 
-    d = df.copy()
-
-    # 연도 추출
-    d["year"] = d[ymd_col].astype(str).str[:4]
-
     # 결측/비수치 방어
-    d[death_col] = pd.to_numeric(d[death_col], errors="coerce").fillna(0)
-    d[inj_col]   = pd.to_numeric(d[inj_col],   errors="coerce").fillna(0)
-
-    # 총사상자 = 사망 + 부상
-    d["casualties"] = d[death_col] + d[inj_col]
-    d["deaths"]     = d[death_col]
-
-    # 연도별 합계
-    cas = d.groupby("year", as_index=False)["casualties"].sum()
-    dea = d.groupby("year", as_index=False)["deaths"].sum()
+    deaths   = pd.to_numeric(df[death_col], errors="coerce").fillna(0).astype("int32")
+    injuries = pd.to_numeric(df[inj_col],   errors="coerce").fillna(0).astype("int32")
+
+    # 원본 전체를 복사하지 않고 집계에 필요한 컬럼만으로 구성
+    d = pd.DataFrame({
+        # 연도 추출 (YYYYMMDD 정수 → 정수 나눗셈)
+        "year": pd.to_numeric(df[ymd_col], errors="coerce") // 10000,
+        # 총사상자 = 사망 + 부상
+        "casualties": deaths + injuries,
+        "deaths": deaths,
+    })
 
-    merged = cas.merge(dea, on="year", how="left")
+    # 연도별 합계 (총사상자·사망자를 한 번의 groupby로 → merge 불필요)
+    merged = d.groupby("year", as_index=False)[["casualties", "deaths"]].sum()
     merged["injuries"] = (merged["casualties"] - merged["deaths"]).clip(lower=0).astype(int)
 
     # 정리: year, deaths, injuries만 사용
@@ -99,7 +107,7 @@ def prep_casualty_stack_area(
         .reset_index(drop=True)
     )
 
-    records = merged.to_dict(orient="records")
+    records = merged.to_json(orient="records", force_ascii=False)
     return merged, records
 
 @st.cache_data(show_spinner=False)
@@ -108,10 +116,12 @@ def prep_mobilization_records(
     date_col: str = "OCRN_YMD",
     total_col: str = "WHOL_MNPW_CNT",
     line_cols: list = None,
-) -> list:
+) -> str:
     """
-    연/월별 동원 인력(막대) + 지원지표(라인)용 레코드 반환.
-    반환 형식: [{year:int, month:int, whol_mnpw_cnt:int, <line cols>...}, ...]
+    연/월별 동원 인력(막대) + 지원지표(라인)용 열 단위 JSON 반환.
+    반환 형식: {years:[int...], y0max:[int...], y1max:[int...],
+               whol_mnpw_cnt:[int...], <line cols>:[int...]}
+    (y0max/y1max는 연도별 막대·라인 축 최댓값, 각 값 배열은 연도 순번 * 12 + 월 - 1 위치)
     """
     if line_cols is None:
         line_cols = [
@@ -122,9 +132,8 @@ def prep_mobilization_records(
             "MBLZ_FFPWR_CNT",      # 소방 인력 동원
         ]
 
-    # 1) 컬럼 소문자 통일
-    d = df.copy()
-    d.columns = [c.lower() for c in d.columns]
+    # 1) 컬럼 소문자 통일 (데이터 복사 없이 라벨만 교체)
+    d = df.set_axis([c.lower() for c in df.columns], axis=1)
     date_col = date_col.lower()
     total_col = total_col.lower()
     line_cols_l = [c.lower() for c in line_cols]
@@ -135,54 +144,59 @@ def prep_mobilization_records(
         missing = need - set(d.columns)
         raise KeyError(f"필수 컬럼 누락: {missing}")
 
-    # 3) 날짜 파싱 / 결측 제거
-    d[date_col] = pd.to_datetime(d[date_col].astype(str), format="%Y%m%d", errors="coerce")
-    d = d.dropna(subset=[date_col, total_col]).copy()
-
-    # 4) 연/월 추출
-    d["year"] = d[date_col].dt.year
-    d["month"] = d[date_col].dt.month
-
-    # 5) 사용 가능한 라인 컬럼만 선택 (없으면 생략)
+    # 3) 사용 가능한 라인 컬럼만 선택 (없으면 생략) → 이후엔 필요한 컬럼만 다룸
     present_line_cols = [c for c in line_cols_l if c in d.columns]
-
-    # 6) 월별 합계
-    monthly_people = (
-        d.groupby(["year", "month"], as_index=False)[total_col].sum()
-         .sort_values(["year", "month"])
-    )
-
-    if present_line_cols:
-        monthly_line = (
-            d.groupby(["year", "month"], as_index=False)[present_line_cols].sum()
-             .sort_values(["year", "month"])
-        )
-        merged = pd.merge(monthly_people, monthly_line, on=["year","month"], how="left")
-    else:
-        merged = monthly_people.copy()
-
-    # 7) (모든 연 × 1~12월) 보정 → 빈달 0 채우기
-    years = sorted(merged["year"].unique().tolist())
-    full_idx = pd.MultiIndex.from_product([years, range(1,13)], names=["year","month"])
-    merged = (
-        merged.set_index(["year","month"])
-              .reindex(full_idx)
-              .fillna(0)
-              .reset_index()
-    )
-
-    # 8) D3가 기대하는 키로 정리 (없는 라인 컬럼은 0으로 생성)
+    d = d[[date_col, total_col] + present_line_cols]
+
+    # 4) 결측 제거 — 날짜(YYYYMMDD 정수)와 총 인력이 모두 있는 행만
+    ymd = pd.to_numeric(d[date_col], errors="coerce")
+    mask = ymd.notna() & d[total_col].notna()
+    ymd = ymd[mask].astype("int32")
+
+    # 5) 연/월 추출 (datetime 파싱 없이 정수 연산: 20220304 → 2022, 3)
+    d = d.loc[mask].assign(year=(ymd // 10000).astype("int16"), month=((ymd // 100) % 100).astype("int8"))
+    d = d[d["month"].between(1, 12)]
+
+    # 6) 월별 합계 → (모든 연 × 1~12월) 격자, 빈달 0
+    #    행마다 격자 위치(연도 순번 * 12 + 월 - 1)를 구해 열별 가중 bincount로 바로 합산
+    #    (groupby 해시/정렬 없이 C 루프 한 번; 인원 합은 float64로도 정확)
+    sum_cols = [total_col] + present_line_cols
+    year_arr = d["year"].to_numpy()
+    years = np.unique(year_arr)
+    pos = np.searchsorted(years, year_arr) * 12 + d["month"].to_numpy(dtype=np.int64) - 1
+    #    월 합계는 수만 명 수준이라 int32로 충분 (JSON에도 정수 그대로 기록)
+    grid = np.column_stack([
+        np.bincount(pos, weights=d[c].to_numpy(dtype=np.float64, na_value=0), minlength=len(years) * 12)
+        for c in sum_cols
+    ]).astype(np.int32)
+
+    merged = pd.DataFrame(grid, columns=sum_cols)
+
+    # 7) D3가 기대하는 키로 정리 (없는 라인 컬럼은 0으로 생성)
     for c in [c for c in line_cols_l if c not in merged.columns]:
         merged[c] = 0
 
+    # 행 순서 = (연도 순번, 월) — 위 격자 배치에서 이미 정렬됨
     merged = merged.rename(columns={total_col: "whol_mnpw_cnt"})
-    # 정렬
-    merged = merged.sort_values(["year","month"]).reset_index(drop=True)
 
-    # 레코드 반환
-    out_cols = ["year","month","whol_mnpw_cnt"] + [c for c in line_cols_l]
-    return merged[out_cols].to_dict(orient="records")
+    # 열 단위 JSON 반환 — 행마다 키 문자열을 반복하지 않도록 컬럼별 배열로
+    #   격자가 (연 × 12개월) 순서로 꽉 차 있으므로 year/month 열은 보내지 않고 연도 목록만 전달
+    out_cols = ["whol_mnpw_cnt"] + [c for c in line_cols_l]
+
+    # 8) 패널(연도)별 축 최댓값 — 막대(y0)는 총 인력, 라인(y1)은 모든 라인 컬럼 중 최댓값
+    #    (JS가 패널마다 d3.max로 다시 훑지 않도록 격자를 (연, 12월) 모양으로 바꿔 한 번에 계산)
+    #    initial=0: 남은 행이 없어 연도가 0개여도(또는 라인 컬럼이 없어도) 빈 배열/0으로 처리
+    y0max = merged["whol_mnpw_cnt"].to_numpy().reshape(len(years), 12).max(axis=1, initial=0)
+    y1max = merged[line_cols_l].to_numpy(dtype=np.int32).reshape(len(years), 12, len(line_cols_l)).max(axis=(1, 2), initial=0)
+
+    return json.dumps({
+        "years": years.tolist(),
+        "y0max": y0max.tolist(),
+        "y1max": y1max.tolist(),
+        **merged[out_cols].to_dict(orient="list"),
+    }, ensure_ascii=False)
 
+@st.cache_data(show_spinner=False)
 def prep_region_year_counts(
     df: pd.DataFrame,
     year_col_candidates: Iterable[str] = ("year", "YEAR", "Year", "연도"),
@@ -216,9 +230,8 @@ def prep_region_year_counts(
     if not isinstance(df, pd.DataFrame):
         raise TypeError("df must be a pandas DataFrame")
 
-    # 1) 컬럼명 정리(공백 제거)
-    df = df.copy()
-    df.columns = [c.strip() for c in df.columns]
+    # 1) 컬럼명 정리(공백 제거) — 데이터 복사 없이 라벨만 교체
+    df = df.set_axis([c.strip() for c in df.columns], axis=1)
 
     # 2) year 컬럼 탐색(후보 우선)
     year_col = None
@@ -237,22 +250,26 @@ def prep_region_year_counts(
     if year_col is None or region_col not in df.columns:
         raise ValueError(f"필수 컬럼이 없습니다: year({year_col_candidates}) 또는 {region_col}")
 
+    # 집계에 필요한 두 컬럼만 남기고 이후 단계 진행
+    df = df[[year_col, region_col]].copy()
+
     # 3) 연도 숫자화(+결측 제거)
     df[year_col] = pd.to_numeric(df[year_col], errors="coerce")
     df = df.dropna(subset=[year_col])
     df[year_col] = df[year_col].astype(int)
 
-    # 4) 지역 공백/결측 처리
-    if drop_na_region:
-        df[region_col] = df[region_col].astype(str).str.strip()
-        df = df[df[region_col].ne("") & df[region_col].ne("nan")]
-
-    # 5) 연도 필터
+    # 4) 연도 필터 (값싼 숫자 비교를 문자열 처리보다 먼저)
     if year_range is not None:
         ymin, ymax = year_range
         df = df[(df[year_col] >= ymin) & (df[year_col] <= ymax)]
 
-    # 6) 집계
+    # 5) 지역 공백/결측 처리
+    if drop_na_region:
+        df[region_col] = df[region_col].astype(str).str.strip()
+        df = df[df[region_col].ne("") & df[region_col].ne("nan")]
+
+    # 6) 집계 (지역은 category로 바꿔 문자열 대신 정수 코드로 그룹화)
+    df[region_col] = df[region_col].astype("category")
     counts = (
         df.groupby([year_col, region_col], observed=True)
           .size()
@@ -261,7 +278,7 @@ def prep_region_year_counts(
     )
 
     # 7) JSON 변환(D3 템플릿용)
-    data_json = json.dumps(counts.to_dict(orient="records"), ensure_ascii=False)
+    data_json = counts.to_json(orient="records", force_ascii=False)
 
     return counts, data_json
 
@@ -316,13 +333,86 @@ overlay = None
 if not st.session_state["boot_done"]:
     overlay = show_loading_overlay()
 
-df_whole = pd.read_csv('../data/전국_산불현황_정렬_2016_2024.csv')
-df_gangwon = pd.read_csv('../data/강원도_2016-2022.csv')
+@st.cache_data(show_spinner=False)
+def load_whole() -> pd.DataFrame:
+    return pd.read_csv(
+        '../data/전국_산불현황_정렬_2016_2024.csv',
+        engine="pyarrow",
+        usecols=["startyear"],
+        dtype={"startyear": "int16"},
+    ).sort_values("startyear", ignore_index=True)  # 파일이 이미 연도순이지만 구간 이진 탐색을 위해 보장
+
+@st.cache_data(show_spinner=False)
+def load_gangwon() -> pd.DataFrame:
+    return pd.read_csv(
+        '../data/강원도_2016-2022.csv',
+        engine="pyarrow",
+        # 페이지에서 실제로 쓰는 컬럼만 파싱
+        usecols=[
+            "OCRN_YMD", "year", "FIRE_OCRN_HR", "GRNDS_SGG_NM",
+            "IGTN_HTSRC_LCLSF_NM", "IGTN_CS_NM",
+            "DCSD_CNT", "INJPSN_CNT",
+            "WHOL_MNPW_CNT", "MBLZ_POLICEO_CNT", "MBLZ_SOLD_CNT",
+            "MBLZ_GNRL_OCPT_NOPE", "ETC_MBLZ_NOPE", "MBLZ_FFPWR_CNT",
+        ],
+        # 건수/인원은 값 범위가 작아 기본 int64 대신 좁은 정수형(결측 허용)으로
+        dtype={
+            "OCRN_YMD": "int32", "year": "int16", "FIRE_OCRN_HR": "int32",
+            "DCSD_CNT": "Int16", "INJPSN_CNT": "Int16",
+            "WHOL_MNPW_CNT": "Int32", "MBLZ_POLICEO_CNT": "Int32", "MBLZ_SOLD_CNT": "Int32",
+            "MBLZ_GNRL_OCPT_NOPE": "Int32", "ETC_MBLZ_NOPE": "Int32", "MBLZ_FFPWR_CNT": "Int32",
+        },
+    )
 
 @st.cache_data(show_spinner=False)
+def load_burnt_area() -> pd.DataFrame:
+    return pd.read_csv(
+        '../data/burnt_area_merged_16-22.csv',
+        engine="pyarrow",
+        # 버블 차트는 지역명과 피해면적만 사용
+        usecols=["GRNDS_SGG_NM", "피해면적_합계"],
+        # 지역명은 고유값이 십수 개뿐이라 파싱 단계에서 category로 (groupby가 정수 코드로 동작)
+        dtype={"GRNDS_SGG_NM": "category", "피해면적_합계": "float64"},
+    )
+
+df_whole = load_whole()
+df_gangwon = load_gangwon()
+
+@st.cache_resource(show_spinner=False)
 def load_html(p: Path) -> str:
+    """HTML 템플릿/정적 페이지. 문자열은 불변이라 피클/복사 없이 프로세스 전체에서 공유(지도는 수십 MB)."""
     return p.read_text(encoding="utf-8")
 
+@st.cache_resource(show_spinner=False)
+def load_template(p: Path) -> Tuple[str, ...]:
+    """템플릿을 __KEY__ 자리표시자 기준으로 미리 쪼갠 조각: (텍스트, KEY, 텍스트, KEY, ..., 텍스트)."""
+    return tuple(re.split(r"__([A-Z][A-Z_]*?)__", load_html(p)))
+
+def render_template(parts: Tuple[str, ...], **placeholders: str) -> str:
+    """load_template 조각의 KEY 자리(홀수 번째)에 placeholders[KEY]를 끼워 이어 붙인 HTML 반환."""
+    return "".join(
+        placeholders.get(part, f"__{part}__") if i % 2 else part
+        for i, part in enumerate(parts)
+    )
+
+def to_json(data) -> str:
+    """D3 템플릿 주입용 JSON 문자열 (DataFrame은 records 형식, 문자열은 그대로)."""
+    if isinstance(data, str):
+        return data
+    if isinstance(data, pd.DataFrame):
+        return data.to_json(orient="records", force_ascii=False)
+    return json.dumps(data, ensure_ascii=False)
+
+@st.cache_resource(show_spinner=False)
+def render_chart(p: Path, **data) -> str:
+    """
+    템플릿 로드 → JSON 직렬화 → 자리표시자 치환까지 한 번에 수행해 완성된 HTML 반환.
+    입력 데이터가 같으면 재실행 시 캐시된 HTML을 그대로 돌려준다
+    (결과 문자열은 불변이라 cache_resource로 피클 없이 공유).
+    """
+    return render_template(load_template(p), **{key: to_json(value) for key, value in data.items()})
+
+@st.cache_data(show_spinner=False)
 def prep_hourly_cause(
     df: pd.DataFrame,
     hour_col: str = "FIRE_OCRN_HR",
@@ -331,7 +421,7 @@ def prep_hourly_cause(
 ):
     """
     시간대별 총 건수(막대) + 원인별 시간대 건수(라인)용 데이터 전처리.
-    반환값:
+    반환값(JSON 문자열):
       data_hourly: [{hour:0..23, count:int}, ...]
       data_cause : [{cause:str, hour:int(0..23), count:int}, ...]
     """
@@ -339,81 +429,119 @@ def prep_hourly_cause(
     if hour_col not in df.columns or cause_col not in df.columns:
         raise KeyError(f"입력 DataFrame에 필요한 컬럼이 없습니다: {hour_col}, {cause_col}")
 
-    d = df.copy()
+    # 1) 시간(0~23) 추출 (HHMMSS 정수 → 정수 나눗셈으로 HH, 예: 93000 → 9)
+    hour = pd.to_numeric(df[hour_col], errors='coerce') // 10000
+    valid = hour.between(0, 23)
+    hour = hour[valid].astype(int)
 
-    # 1) 시간(0~23) 추출 (예: '0930', '9', '09', '09:30' 등 → 앞 1~2자리)
-    d['hour'] = d['FIRE_OCRN_HR'].astype(str).str.zfill(6).str[:2]
-    d['hour'] = pd.to_numeric(d['hour'], errors='coerce')
-    d.dropna(subset=['hour'], inplace=True)
-    d['hour'] = d['hour'].astype(int)
-
-    # 2) 원인 정리 (결측/공백 → '미상')
-    cause_raw = d[cause_col].fillna("미상").astype(str).str.strip()
-    d["cause"] = cause_raw.replace({"": "미상"})
+    # 2) 원인 정리 (결측/공백 → '미상') — 문자열 정리는 고유값에만 한 번씩 적용
+    codes, uniques = pd.factorize(df.loc[valid, cause_col])
+    labels = pd.Series(uniques).astype(str).str.strip().replace({"": "미상"})
+    # 결측은 code == -1 → 맨 뒤에 붙인 '미상'을 가리킴
+    cause = pd.Series(np.append(labels.to_numpy(dtype=object), "미상")[codes], index=hour.index)
 
     # 3) 상위 N개 원인만 라인으로, 나머지는 '기타'
+    #    (원인은 category로 두어 groupby가 문자열 대신 정수 코드로 동작하도록)
     if top_n is not None and top_n > 0:
-        top_causes = d["cause"].value_counts().nlargest(top_n).index
-        d["cause_top"] = np.where(d["cause"].isin(top_causes), d["cause"], "기타")
+        # 고유값별 건수 → 건수 내림차순, 동률은 먼저 등장한 원인 우선 (value_counts().head(top_n)와 동일)
+        values, first_idx, counts = np.unique(cause.to_numpy(dtype=str), return_index=True, return_counts=True)
+        top_causes = values[np.lexsort((first_idx, -counts))[:top_n]]
+        categories = sorted(set(top_causes) | {"기타"})
+        # 상위 원인이 아니면(code == -1) '기타' 코드로 한 번에 치환
+        codes = pd.Index(categories).get_indexer(cause)
+        codes[codes == -1] = categories.index("기타")
+        cause_top = pd.Series(
+            pd.Categorical.from_codes(codes, categories=categories), index=cause.index
+        )
     else:
         # top_n=None 이면 전체 사용
-        d["cause_top"] = d["cause"]
-
-    # 4) 시간대 총 발생 건수(바)
-    hourly = (
-        d.groupby("hour", as_index=False)
-         .size()
-         .rename(columns={"size": "count"})
-         .set_index("hour")
-         .reindex(range(24), fill_value=0)  # 0~23 모두 포함
-         .reset_index()
-    )
-    data_hourly = hourly.to_dict(orient="records")
+        cause_top = cause.astype("category")
 
-    # 5) 원인별-시간대 발생건수(선) + 빠진 조합 0 채우기
-    cause_hour = (
-        d.groupby(["cause_top", "hour"], as_index=False)
-         .size()
-         .rename(columns={"cause_top": "cause", "size": "count"})
-    )
-    all_causes = sorted(cause_hour["cause"].unique().tolist())
-    full_index = pd.MultiIndex.from_product([all_causes, range(24)], names=["cause", "hour"])
-    cause_hour = (
-        cause_hour.set_index(["cause", "hour"])
-                  .reindex(full_index, fill_value=0)
-                  .reset_index()
-    )
-    data_cause = cause_hour.to_dict(orient="records")
+    # 원본 복사 없이 집계에 필요한 두 컬럼만으로 구성
+    d = pd.DataFrame({"hour": hour.astype("int8"), "cause_top": cause_top})
 
-    return data_hourly, data_cause
+    # 4) 시간대 총 발생 건수(바) — 0~23 모두 포함
+    hourly = pd.DataFrame({
+        "hour": np.arange(24),
+        "count": np.bincount(d["hour"].to_numpy(), minlength=24),
+    })
+    data_hourly = hourly.to_json(orient="records", force_ascii=False)
+
+    # 5) 원인별-시간대 발생건수(선) + 빠진 조합 0 채우기 (원인 × 0~23시 격자)
+    #    (원인 코드 * 24 + 시간)을 한 번에 bincount → (원인 수, 24) 행렬
+    causes = d["cause_top"].cat.categories
+    flat = d["cause_top"].cat.codes.to_numpy(dtype=np.int64) * 24 + d["hour"].to_numpy()
+    grid = np.bincount(flat, minlength=len(causes) * 24).reshape(len(causes), 24)
+    observed = grid.sum(axis=1) > 0  # 실제로 등장한 원인만
+    cause_hour = pd.DataFrame({
+        "cause": np.repeat(causes[observed].to_numpy(), 24),
+        "hour":  np.tile(np.arange(24), observed.sum()),
+        "count": grid[observed].ravel(),
+    })
+    data_cause = cause_hour.to_json(orient="records", force_ascii=False)
 
-def prep_month_season_chart(df: pd.DataFrame):
-    # --- 연/월 추출 (OCRN_YMD: YYYYMMDD) ---
-    df = df.copy()
-    df["year"]  = pd.to_numeric(df["OCRN_YMD"].astype(str).str[:4],  errors="coerce")
-    df["month"] = pd.to_numeric(df["OCRN_YMD"].astype(str).str[4:6], errors="coerce")
-    df = df.dropna(subset=["year","month"])
-    df["year"]  = df["year"].astype(int)
-    df["month"] = df["month"].astype(int)
+    return data_hourly, data_cause
 
-    # (선택) 연도 필터 UI
-    min_y, max_y = int(df["year"].min()), int(df["year"].max())
+@st.cache_data(show_spinner=False)
+def prep_national_year_counts(df: pd.DataFrame, year_range: Tuple[int, int] = (2016, 2022)) -> pd.DataFrame:
+    """전국 연도별 건수 (재실행마다 바뀌지 않으므로 한 번만 계산)."""
+    # 연도별 건수 계산 (기본 2016~2022년만) — 먼저 거른 뒤 연도 구간 bincount
+    #   startyear는 load_whole에서 정렬돼 있으므로 마스크 대신 이진 탐색으로 구간만 잘라냄(복사 없음)
+    y1, y2 = year_range
+    years = df["startyear"].to_numpy()
+    lo, hi = np.searchsorted(years, [y1, y2 + 1])
+    years = years[lo:hi]
 
-    y1, y2 = st.slider("📅 연도 범위 선택", min_value=min_y, max_value=max_y, value=(min_y, max_y), step=1)
-    df = df[(df["year"] >= y1) & (df["year"] <= y2)].copy()
+    # DataFrame 형식으로 변환
+    return pd.DataFrame({
+        "year": np.arange(y1, y2 + 1),
+        "count": np.bincount(years - y1, minlength=y2 - y1 + 1),
+    })
 
-    # 월(1~12) 카운트 → 빈월 0 채움
-    month_counts = (df["month"].value_counts()
-                        .reindex(range(1,13), fill_value=0)
-                        .sort_index())
+@st.cache_data(show_spinner=False)
+def prep_year_month_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """OCRN_YMD(YYYYMMDD) → 연도 × 월 건수표 (index=year, columns=1~12)."""
+    # --- 연/월 추출 (OCRN_YMD: YYYYMMDD 정수 → 정수 나눗셈) ---
+    ymd = pd.to_numeric(df["OCRN_YMD"], errors="coerce").dropna().astype(np.int32).to_numpy()
+    year, month = ymd // 10000, (ymd // 100) % 100
+    valid = (month >= 1) & (month <= 12)
+    year, month = year[valid], month[valid]
+
+    # (연도 오프셋 * 12 + 월 - 1)을 한 번에 bincount → (연도 수, 12) 행렬
+    years = np.arange(year.min(), year.max() + 1)
+    flat = (year - years[0]) * 12 + (month - 1)
+    grid = np.bincount(flat, minlength=len(years) * 12).reshape(len(years), 12)
+    return pd.DataFrame(grid, index=years, columns=range(1, 13))
+
+def prep_month_season_chart(counts: pd.DataFrame, year_range: Tuple[int, int]) -> pd.DataFrame:
+    """연도 × 월 건수표에서 선택한 연도 범위의 행만 더해 월별(1~12) 건수 집계."""
+    y1, y2 = year_range
+    month_counts = counts.loc[y1:y2].sum()
 
     # D3용 DataFrame (month, count)
     months_df = pd.DataFrame({
-        "month": list(range(1,13)),     # 1~12
-        "count": month_counts.values
+        "month": np.arange(1, 13),     # 1~12
+        "count": month_counts.to_numpy()
     })
     return months_df
 
+@st.fragment
+def render_month_season_chart(df: pd.DataFrame):
+    """연도 슬라이더 + 월별 차트. 슬라이더를 움직이면 페이지 전체가 아니라 이 블록만 재실행된다."""
+    # (선택) 연도 필터 UI
+    counts = prep_year_month_counts(df)
+    min_y, max_y = int(counts.index.min()), int(counts.index.max())
+
+    y1, y2 = st.slider("📅 연도 범위 선택", min_value=min_y, max_value=max_y, value=(min_y, max_y), step=1)
+    months_df = prep_month_season_chart(counts, (y1, y2))
+
+    # D3 템플릿 로드 & 데이터 치환
+    TPL_PATH = Path("../components/강원_월별_발생수.html")   # 아래 HTML 템플릿 파일명
+    html_filled = render_chart(TPL_PATH, DATA_JSON=months_df)
+
+    # 렌더
+    components.html(html_filled, height=400, scrolling=False)
+
 left, center, right = st.columns([1, 2, 1]) 
 
 with center:
@@ -457,22 +585,18 @@ with center:
         2021년에는 349건으로 큰 폭의 감소가 나타났지만, 2022년에는 756건으로 급격히 증가하며 조사 기간 중 가장 많은 화재 건수를 기록했습니다.
     """)
 
-    # 연도별 건수 계산 (2016~2022년만)
-    year_counts = df_whole['startyear'].value_counts().sort_index()
-    year_counts_filtered = year_counts.loc[(year_counts.index >= 2016) & (year_counts.index <= 2022)]
+    chart_data = prep_national_year_counts(df_whole)
 
-    # DataFrame 형식으로 변환
-    chart_data = year_counts_filtered.reset_index()
-    chart_data.columns = ['year', 'count']
-
-    
-    data_json = json.dumps(chart_data.to_dict(orient='records'), ensure_ascii=False)
     HTML_PATH = Path('../components/전국_연도별_발생수.html')
-    html_src = HTML_PATH.read_text(encoding="utf-8")
-    html_filled = html_src.replace("__DATA_JSON__", data_json)
+    html_filled = render_chart(HTML_PATH, DATA_JSON=chart_data)
 
     components.html(html_filled, height=450, scrolling=False)
 
+    # 첫 차트가 나가면 바로 오버레이 제거 (나머지 섹션은 이어서 스트리밍)
+    if overlay is not None:
+        overlay.empty()
+        st.session_state["boot_done"] = True
+
     st.subheader("📊 지역별 화재 발생 비교")
     st.markdown("""
         **강원도 동부와 경상북도 동해안 지역**은 산불 발생 건수와 평균 피해 면적 모두에서 높은 수치를 보여 전형적인 **고위험 지역**임을 알 수 있다.  
@@ -557,16 +681,12 @@ with center:
         """
     )
 
-    # 연도별 건수 계산 (2016~2022) ---
-    year_series = pd.to_numeric(df_gangwon['OCRN_YMD'].astype(str).str[:4], errors='coerce').dropna().astype(int)
-    year_counts = year_series.value_counts().sort_index()
-    chart_data = year_counts.reset_index()
-    chart_data.columns = ['year', 'count']
+    # 연도별 건수 계산 (2016~2022) --- 연도 × 월 건수표의 행 합계
+    yearly = prep_year_month_counts(df_gangwon).sum(axis=1)
+    chart_data = pd.DataFrame({'year': yearly.index, 'count': yearly.to_numpy()})
 
-    data_json = json.dumps(chart_data.to_dict(orient='records'), ensure_ascii=False)
     HTML_PATH = Path('../components/전국_연도별_발생수.html')
-    html_src = HTML_PATH.read_text(encoding="utf-8")
-    html_filled = html_src.replace("__DATA_JSON__", data_json)
+    html_filled = render_chart(HTML_PATH, DATA_JSON=chart_data)
 
     components.html(html_filled, height=450, scrolling=False)
 
@@ -582,17 +702,7 @@ with center:
         """
     )
 
-    months_df = prep_month_season_chart(df_gangwon)
-
-    # D3 템플릿 로드 & 데이터 치환
-    TPL_PATH = Path("../components/강원_월별_발생수.html")   # 아래 HTML 템플릿 파일명
-    html_src  = TPL_PATH.read_text(encoding="utf-8")
-    data_json = json.dumps(months_df.to_dict(orient="records"), ensure_ascii=False)
-
-    html_filled = html_src.replace("__DATA_JSON__", data_json)
-
-    # 렌더
-    components.html(html_filled, height=400, scrolling=False)
+    render_month_season_chart(df_gangwon)
 
     st.markdown('📍 **시간대별 비교**')
     st.markdown(
@@ -610,19 +720,12 @@ with center:
     data_hourly, data_cause = prep_hourly_cause(df_gangwon, top_n=5)
 
     HTML_PATH = Path("../components/강원_시간별_화재요인별_발생수.html")  # 경로 확인/조정
-    html_src = HTML_PATH.read_text(encoding="utf-8")
-
-    html_filled = (
-        html_src
-        .replace("__DATA_HOURLY__", json.dumps(data_hourly, ensure_ascii=False))
-        .replace("__DATA_CAUSE__",  json.dumps(data_cause,  ensure_ascii=False))
-    )
+    html_filled = render_chart(HTML_PATH, DATA_HOURLY=data_hourly, DATA_CAUSE=data_cause)
 
     components.html(html_filled, height=415, scrolling=False)
 
     data_treemap = prep_treemap_ignition_cause(df_gangwon)
-    html_src = Path("../components/강원_화재요인별_발생수.html").read_text(encoding="utf-8")
-    html_filled = html_src.replace("__DATA_JSON__", json.dumps(data_treemap, ensure_ascii=False))
+    html_filled = render_chart(Path("../components/강원_화재요인별_발생수.html"), DATA_JSON=data_treemap)
 
 # 렌더링
 components.html(html_filled, height=600, scrolling=False)
@@ -651,16 +754,14 @@ with center:
     )
 
     HTML_PATH = Path("../components/강원_지역별_발생수.html")
-    html_src = HTML_PATH.read_text(encoding="utf-8")
-    html_filled = html_src.replace("__DATA_JSON__", data_json)
+    html_filled = render_chart(HTML_PATH, DATA_JSON=data_json)
 
     components.html(html_filled, height=560, scrolling=False)
 
     # 🔄 전처리 함수 호출
-    data_json = prep_bubble_data(pd.read_csv("../data/burnt_area_merged_16-22.csv"))
+    data_json = prep_bubble_data(load_burnt_area())
 
-    html_src = Path("../components/강원_피해규모별_버블차트.html").read_text(encoding="utf-8")
-    html_filled = html_src.replace("__DATA_JSON__", json.dumps(data_json, ensure_ascii=False))
+    html_filled = render_chart(Path("../components/강원_피해규모별_버블차트.html"), DATA_JSON=data_json)
 
     # 📊 렌더링
     components.html(html_filled, height=600, scrolling=False)
@@ -692,8 +793,7 @@ with center:
     records = prep_mobilization_records(df_gangwon)
     # HTML 템플릿 로드 & 데이터 주입
     TPL = Path("../components/강원_역할별_인력수.html")
-    html_src = TPL.read_text(encoding="utf-8")
-    html_filled = html_src.replace("__DATA_JSON__", json.dumps(records, ensure_ascii=False))
+    html_filled = render_chart(TPL, DATA_JSON=records)
 
 left, center, right = st.columns([1, 12, 1]) 
 
@@ -718,8 +818,7 @@ with center:
     )
     
     merged, records = prep_casualty_stack_area(df_gangwon)
-    html_src = Path("../components/강원_상태별_사상자수.html").read_text(encoding="utf-8")
-    html_filled = html_src.replace("__DATA_JSON__", json.dumps(records, ensure_ascii=False))
+    html_filled = render_chart(Path("../components/강원_상태별_사상자수.html"), DATA_JSON=records)
 
     components.html(html_filled, height=440, scrolling=False)
 
@@ -759,9 +858,3 @@ with center:
         - **특징**: 강풍으로 인해 강릉·동해 해안선을 따라 빠르게 확산, 고속도로 통제 및 대피령 발령
         - **대응**: 소방청, 산림청, 군부대 등 총력 대응, 헬기 30대 투입, 인력 1,500명 이상 동원
         """)
-
-# 페이지 Road
-time.sleep(1)  # 렌더링 안정성 위해 약간의 지연
-if overlay is not None:
-    overlay.empty()
-    st.session_state["boot_done"] = True
\ No newline at end of file